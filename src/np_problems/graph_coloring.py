@@ -1,12 +1,362 @@
 import itertools
 import random
 import time
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import Manager
 from typing import List, Tuple, Dict, Set
+import numpy as np
+
+INCLUSION_EXCLUSION_CHUNK = 1 << 20
+COUNT_COLORINGS_MAX_VERTICES = 30
+STOP_POLL = 256
+
+def _dsatur(adj, colors=None):
+    n = len(adj)
+    colors = [-1] * n if colors is None else colors[:]
+    neighbor_colors = [set() for _ in range(n)]
+    for v in range(n):
+        if colors[v] >= 0:
+            for u in adj[v]:
+                neighbor_colors[u].add(colors[v])
+    steps = 0
+    
+    for _ in range(colors.count(-1)):
+        steps += 1
+        v = max((u for u in range(n) if colors[u] < 0),
+                key=lambda u: (len(neighbor_colors[u]), len(adj[u])))
+        color = 0
+        while color in neighbor_colors[v]:
+            color += 1
+        colors[v] = color
+        for u in adj[v]:
+            neighbor_colors[u].add(color)
+    
+    return colors, steps
+
+def _greedy_clique(adj):
+    neighbor_sets = [set(neighbors) for neighbors in adj]
+    best = []
+    for seed in sorted(range(len(adj)), key=lambda v: -len(adj[v])):
+        if len(adj[seed]) < len(best):
+            break
+        clique = [seed]
+        candidates = set(neighbor_sets[seed])
+        while candidates:
+            v = max(candidates, key=lambda u: len(candidates & neighbor_sets[u]))
+            clique.append(v)
+            candidates &= neighbor_sets[v]
+        if len(clique) > len(best):
+            best = clique
+    return best
+
+def _tabucol_moves(adj, k, seed=None):
+    n = len(adj)
+    rng = np.random.default_rng(seed)
+    colors = rng.integers(k, size=n)
+    neighbors = [np.array(sorted(neighbors_v), dtype=np.int64) for neighbors_v in adj]
+    sources = np.repeat(np.arange(n), [len(neighbors_v) for neighbors_v in adj])
+    targets = np.concatenate(neighbors) if n else np.zeros(0, dtype=np.int64)
+    gamma = np.zeros((n, k), dtype=np.int32)
+    np.add.at(gamma, (sources, colors[targets]), 1)
+    tabu = np.zeros((n, k), dtype=np.int64)
+    rows = np.arange(n)
+    conflicts = int(gamma[rows, colors].sum()) // 2
+    best = conflicts
+    iteration = 0
+    
+    while True:
+        yield colors, gamma, conflicts
+        
+        own = gamma[rows, colors]
+        bad = np.flatnonzero(own)
+        if not len(bad) or k < 2:
+            return
+        
+        delta = gamma[bad] - own[bad, None]
+        delta[(tabu[bad] > iteration) & (conflicts + delta >= best)] = n + 1
+        delta[np.arange(len(bad)), colors[bad]] = n + 1
+        lowest = delta.min()
+        if lowest > n:
+            i = int(rng.integers(len(bad)))
+            color = (int(colors[bad[i]]) + 1 + int(rng.integers(k - 1))) % k
+        else:
+            moves = np.flatnonzero(delta == lowest)
+            i, color = divmod(int(moves[rng.integers(len(moves))]), k)
+        
+        v = int(bad[i])
+        old = int(colors[v])
+        conflicts += int(gamma[v, color]) - int(gamma[v, old])
+        colors[v] = color
+        gamma[neighbors[v], old] -= 1
+        gamma[neighbors[v], color] += 1
+        tabu[v, old] = iteration + int(0.6 * len(bad)) + int(rng.integers(10))
+        best = min(best, conflicts)
+        iteration += 1
+
+def _tabucol(adj, k, max_iterations, seed=None, stop=None):
+    iteration = 0
+    for colors, gamma, conflicts in _tabucol_moves(adj, k, seed):
+        if conflicts == 0:
+            return colors.tolist(), iteration
+        if iteration == max_iterations:
+            break
+        if stop is not None and iteration % STOP_POLL == 0 and stop.is_set():
+            return None, iteration
+        iteration += 1
+    
+    return None, iteration
+
+def _tabucol_worker(adj, k, max_iterations, seed, stop):
+    colors, iterations = _tabucol(adj, k, max_iterations, seed, stop)
+    if colors is not None:
+        stop.set()
+    return colors, iterations
+
+def _color_search_worker(adj_masks, k, preassigned, stop):
+    colors, steps = _bitset_color_search(adj_masks, k, preassigned, stop)
+    if colors is not None:
+        stop.set()
+    return colors, steps
+
+def _symmetric_prefixes(adj_masks, order, k):
+    prefixes = [()]
+    for v in order:
+        extended = []
+        for prefix in prefixes:
+            used = max((color for _, color in prefix), default=-1) + 1
+            for color in range(min(used + 1, k)):
+                if all(color != other or not adj_masks[v] >> u & 1 for u, other in prefix):
+                    extended.append(prefix + ((v, color),))
+        prefixes = extended
+    return prefixes
+
+def _bitset_color_search(adj_masks, k, preassigned=(), stop=None):
+    n = len(adj_masks)
+    if n == 0:
+        return [], 0
+    if k <= 0:
+        return None, 0
+    
+    degree = [bin(mask).count('1') for mask in adj_masks]
+    domains = [(1 << k) - 1] * n
+    colors = [-1] * n
+    uncolored = (1 << n) - 1
+    trail = []
+    steps = 0
+    
+    if k <= 16:
+        popcount = [bin(mask).count('1') for mask in range(1 << k)].__getitem__
+    else:
+        popcount = lambda mask: bin(mask).count('1')
+    
+    def most_constrained(limit):
+        best_v = -1
+        best_key = None
+        rest = uncolored
+        while rest:
+            low = rest & -rest
+            u = low.bit_length() - 1
+            rest ^= low
+            key = popcount(domains[u] & limit) * n - degree[u]
+            if best_key is None or key < best_key:
+                best_v, best_key = u, key
+        return best_v
+    
+    used = 0
+    for v, color in preassigned:
+        if not domains[v] >> color & 1:
+            return None, steps
+        colors[v] = color
+        uncolored &= ~(1 << v)
+        used = max(used, color + 1)
+        rest = adj_masks[v] & uncolored
+        while rest:
+            bit = rest & -rest
+            u = bit.bit_length() - 1
+            rest ^= bit
+            domains[u] &= ~(1 << color)
+            if not domains[u]:
+                return None, steps
+    if not uncolored:
+        return colors, steps
+    
+    limit = (1 << min(used + 1, k)) - 1
+    v = most_constrained(limit)
+    stack = [(v, domains[v] & limit, 0, used)]
+    next_poll = 0
+    while stack:
+        if stop is not None and steps >= next_poll:
+            if stop.is_set():
+                return None, steps
+            next_poll = steps + STOP_POLL
+        
+        v, candidates, mark, used = stack[-1]
+        while len(trail) > mark:
+            u, domain = trail.pop()
+            domains[u] = domain
+        if colors[v] >= 0:
+            colors[v] = -1
+            uncolored |= 1 << v
+        
+        if not candidates:
+            stack.pop()
+            continue
+        
+        low = candidates & -candidates
+        color = low.bit_length() - 1
+        stack[-1] = (v, candidates ^ low, mark, used)
+        steps += 1
+        
+        colors[v] = color
+        uncolored &= ~(1 << v)
+        wiped_out = False
+        rest = adj_masks[v] & uncolored
+        while rest:
+            bit = rest & -rest
+            u = bit.bit_length() - 1
+            rest ^= bit
+            if domains[u] & low:
+                trail.append((u, domains[u]))
+                domains[u] ^= low
+                if not domains[u]:
+                    wiped_out = True
+                    break
+        if wiped_out:
+            continue
+        if not uncolored:
+            return colors, steps
+        
+        used = max(used, color + 1)
+        limit = (1 << min(used + 1, k)) - 1
+        w = most_constrained(limit)
+        stack.append((w, domains[w] & limit, len(trail), used))
+    
+    return None, steps
+
+def _popcounts(bits):
+    counts = np.zeros(1 << bits, dtype=np.uint8)
+    for j in range(bits):
+        width = 1 << j
+        counts[width:2 * width] = counts[:width] + 1
+    return counts
+
+def _zeta_transform(values, bits):
+    for j in range(bits):
+        view = values.reshape(values.shape[:-1] + (-1, 2, 1 << j))
+        view[..., 1, :] += view[..., 0, :]
+
+def _large_primes():
+    candidate = 2 ** 31 - 1
+    while True:
+        d, r = candidate - 1, 0
+        while d % 2 == 0:
+            d //= 2
+            r += 1
+        for base in (2, 3, 5, 7):
+            x = pow(base, d, candidate)
+            if x in (1, candidate - 1):
+                continue
+            for _ in range(r - 1):
+                x = x * x % candidate
+                if x == candidate - 1:
+                    break
+            else:
+                break
+        else:
+            yield candidate
+        candidate -= 2
+
+def _independent_sets(adj, out):
+    out[0] = 1
+    for j in range(len(adj)):
+        width = 1 << j
+        if j in adj[j]:
+            out[width:2 * width] = 0
+            continue
+        lower = sum(1 << u for u in adj[j] if u < j)
+        for start in range(0, width, INCLUSION_EXCLUSION_CHUNK):
+            stop = min(width, start + INCLUSION_EXCLUSION_CHUNK)
+            subsets = np.arange(start, stop, dtype=np.int64)
+            out[width + start:width + stop] = out[start:stop] & ((subsets & lower) == 0)
+    return out
+
+def _power_mod(base, exponent, prime):
+    power = np.ones_like(base)
+    products = 0
+    while exponent:
+        if exponent & 1:
+            power = power * base % prime
+            products += 1
+        exponent >>= 1
+        if exponent:
+            base = base * base % prime
+            products += 1
+    return power, products
+
+def _first_fit(order, indptr, indices):
+    colors = [-1] * (len(indptr) - 1)
+    mark = [-1] * len(indptr)
+    for v in order:
+        for u in indices[indptr[v]:indptr[v + 1]]:
+            if colors[u] >= 0:
+                mark[colors[u]] = v
+        color = 0
+        while mark[color] == v:
+            color += 1
+        colors[v] = color
+    return colors
+
+def _degree_order(indptr):
+    n = len(indptr) - 1
+    degrees = [indptr[v + 1] - indptr[v] for v in range(n)]
+    buckets = [[] for _ in range(max(degrees, default=0) + 1)]
+    for v in range(n):
+        buckets[degrees[v]].append(v)
+    return [v for bucket in reversed(buckets) for v in bucket]
+
+def _degeneracy_order(indptr, indices):
+    n = len(indptr) - 1
+    degrees = [indptr[v + 1] - indptr[v] for v in range(n)]
+    starts = [0] * (max(degrees, default=0) + 1)
+    for degree in degrees:
+        starts[degree] += 1
+    total = 0
+    for degree, size in enumerate(starts):
+        starts[degree] = total
+        total += size
+    
+    position = [0] * n
+    order = [0] * n
+    for v in range(n):
+        position[v] = starts[degrees[v]]
+        order[position[v]] = v
+        starts[degrees[v]] += 1
+    for degree in range(len(starts) - 1, 0, -1):
+        starts[degree] = starts[degree - 1]
+    starts[0] = 0
+    
+    for i in range(n):
+        v = order[i]
+        for u in indices[indptr[v]:indptr[v + 1]]:
+            if degrees[u] > degrees[v]:
+                degree = degrees[u]
+                swap_position = starts[degree]
+                w = order[swap_position]
+                if u != w:
+                    order[position[u]] = w
+                    position[w] = position[u]
+                    order[swap_position] = u
+                    position[u] = swap_position
+                starts[degree] += 1
+                degrees[u] -= 1
+    return order
 
 class GraphColoring:
     
     def __init__(self):
         self.graph = {}
+        self._incremental = None
     
     def add_edge(self, u, v):
         if u not in self.graph:
@@ -16,6 +366,9 @@ class GraphColoring:
         
         self.graph[u].add(v)
         self.graph[v].add(u)
+        
+        if self._incremental is not None:
+            self._repair_coloring(u, v)
     
     def create_random_graph(self, n_nodes=10, edge_prob=0.5):
         self.graph = {i: set() for i in range(n_nodes)}
@@ -26,32 +379,49 @@ class GraphColoring:
                     self.graph[i].add(j)
                     self.graph[j].add(i)
         
+        if self._incremental is not None:
+            self._reoptimize_coloring()
         return self.graph
     
-    def brute_force_coloring(self, k):
-        if not self.graph:
+    def brute_force_coloring(self, k, block_size=1 << 16):
+        if not self.graph or k <= 0:
             return False, {}, 0
         
         nodes = list(self.graph.keys())
         n = len(nodes)
+        index = {node: i for i, node in enumerate(nodes)}
+        edges = np.array(sorted({(min(index[u], index[v]), max(index[u], index[v]))
+                                 for u in nodes for v in self.graph[u]}), dtype=np.int64).reshape(-1, 2)
+        
+        low_digits = 0
+        while low_digits < n and k ** (low_digits + 1) <= block_size:
+            low_digits += 1
+        split = n - low_digits
+        
+        places = k ** np.arange(low_digits - 1, -1, -1, dtype=np.int64)
+        table = (np.arange(k ** low_digits, dtype=np.int64)[:, None] // places % k).astype(
+            np.uint8 if k <= 256 else np.int64)
+        
+        low_edges = edges[edges[:, 0] >= split] - split
+        high_edges = edges[edges[:, 1] < split].tolist()
+        mixed_edges = edges[(edges[:, 0] < split) & (edges[:, 1] >= split)]
+        mixed_high = mixed_edges[:, 0]
+        mixed_low = table[:, mixed_edges[:, 1] - split]
+        valid_low = np.all(table[:, low_edges[:, 0]] != table[:, low_edges[:, 1]], axis=1)
         steps = 0
         
-        for coloring in itertools.product(range(k), repeat=n):
-            steps += 1
-            valid = True
-            
-            for i, node in enumerate(nodes):
-                for neighbor in self.graph[node]:
-                    neighbor_idx = nodes.index(neighbor)
-                    if coloring[i] == coloring[neighbor_idx]:
-                        valid = False
-                        break
-                if not valid:
-                    break
+        for prefix in itertools.product(range(k), repeat=split):
+            if any(prefix[a] == prefix[b] for a, b in high_edges):
+                steps += len(table)
+                continue
             
-            if valid:
+            hits = np.flatnonzero(valid_low & np.all(mixed_low != np.array(prefix, dtype=np.int64)[mixed_high], axis=1))
+            if len(hits):
+                steps += int(hits[0]) + 1
+                coloring = list(prefix) + table[hits[0]].tolist()
                 coloring_dict = {node: coloring[i] for i, node in enumerate(nodes)}
                 return True, coloring_dict, steps
+            steps += len(table)
         
         return False, {}, steps
     
@@ -59,24 +429,9 @@ class GraphColoring:
         if not self.graph:
             return {}, 0
         
-        nodes = list(self.graph.keys())
-        coloring = {}
-        steps = 0
-        
-        for node in nodes:
-            steps += 1
-            used_colors = set()
-            
-            for neighbor in self.graph[node]:
-                if neighbor in coloring:
-                    used_colors.add(coloring[neighbor])
-            
-            for color in range(len(nodes)):
-                if color not in used_colors:
-                    coloring[node] = color
-                    break
-        
-        return coloring, steps
+        nodes, indptr, indices = self.to_csr()
+        colors = _first_fit(range(len(nodes)), indptr.tolist(), indices.tolist())
+        return {node: colors[i] for i, node in enumerate(nodes)}, len(nodes)
     
     def backtracking_coloring(self, k):
         if not self.graph:
@@ -112,47 +467,434 @@ class GraphColoring:
         result = backtrack(0)
         return coloring if result else {}, steps[0]
     
+    def bitset_backtracking_coloring(self, k):
+        if not self.graph:
+            return {}, 0
+        
+        nodes, adj = self._index_graph()
+        adj_masks = [sum(1 << u for u in neighbors) for neighbors in adj]
+        colors, steps = _bitset_color_search(adj_masks, k)
+        if colors is None:
+            return {}, steps
+        return {node: colors[i] for i, node in enumerate(nodes)}, steps
+    
+    def parallel_backtracking_coloring(self, k, workers=None, depth=None):
+        if not self.graph:
+            return {}, 0
+        
+        nodes, adj = self._index_graph()
+        n = len(nodes)
+        adj_masks = [sum(1 << u for u in neighbors) for neighbors in adj]
+        order = sorted(range(n), key=lambda v: -len(adj[v]))
+        workers = workers or os.cpu_count() or 1
+        
+        if depth is None:
+            depth = 1
+            while depth < n and len(_symmetric_prefixes(adj_masks, order[:depth], k)) < 8 * workers:
+                depth += 1
+        prefixes = _symmetric_prefixes(adj_masks, order[:depth], k)
+        steps = len(prefixes)
+        found = None
+        
+        if workers == 1:
+            for prefix in prefixes:
+                found, prefix_steps = _bitset_color_search(adj_masks, k, prefix)
+                steps += prefix_steps
+                if found is not None:
+                    break
+        else:
+            with Manager() as manager, ProcessPoolExecutor(workers) as pool:
+                stop = manager.Event()
+                futures = [pool.submit(_color_search_worker, adj_masks, k, prefix, stop) for prefix in prefixes]
+                for future in as_completed(futures):
+                    colors, prefix_steps = future.result()
+                    steps += prefix_steps
+                    if found is None and colors is not None:
+                        found = colors
+        
+        if found is None:
+            return {}, steps
+        return {node: found[i] for i, node in enumerate(nodes)}, steps
+    
     def welsh_powell_coloring(self):
         if not self.graph:
             return {}, 0
         
+        nodes, indptr, indices = self.to_csr()
+        indptr = indptr.tolist()
+        colors = _first_fit(_degree_order(indptr), indptr, indices.tolist())
+        return {node: colors[i] for i, node in enumerate(nodes)}, len(nodes) + len(indices)
+    
+    def smallest_last_coloring(self):
+        if not self.graph:
+            return {}, 0
+        
+        nodes, indptr, indices = self.to_csr()
+        indptr = indptr.tolist()
+        indices = indices.tolist()
+        order = _degeneracy_order(indptr, indices)
+        colors = _first_fit(reversed(order), indptr, indices)
+        return {node: colors[i] for i, node in enumerate(nodes)}, len(nodes) + 2 * len(indices)
+    
+    def to_csr(self):
         nodes = list(self.graph.keys())
-        steps = 0
+        index = {node: i for i, node in enumerate(nodes)}
+        degrees = np.fromiter((len(self.graph[node]) for node in nodes), dtype=np.int64, count=len(nodes))
+        indptr = np.zeros(len(nodes) + 1, dtype=np.int64)
+        np.cumsum(degrees, out=indptr[1:])
+        neighbors = itertools.chain.from_iterable(self.graph[node] for node in nodes)
+        if nodes != list(range(len(nodes))):
+            neighbors = map(index.__getitem__, neighbors)
+        indices = np.fromiter(neighbors, dtype=np.int64, count=int(indptr[-1]))
+        return nodes, indptr, indices
+    
+    def dsatur_coloring(self):
+        if not self.graph:
+            return {}, 0
         
-        degree = {node: len(self.graph[node]) for node in nodes}
-        sorted_nodes = sorted(nodes, key=lambda x: degree[x], reverse=True)
+        nodes, adj = self._index_graph()
+        colors, steps = _dsatur(adj)
+        return {node: colors[i] for i, node in enumerate(nodes)}, steps
+    
+    def tabucol_coloring(self, k=None, workers=None, max_iterations=10000, seed=None):
+        if not self.graph:
+            return {}, 0
         
-        coloring = {}
-        current_color = 0
+        nodes, adj = self._index_graph()
+        if k is None:
+            best, steps = _dsatur(adj)
+            target = max(best)
+        else:
+            best, steps, target = None, 0, k
         
-        while sorted_nodes:
-            steps += 1
-            node = sorted_nodes.pop(0)
-            
+        workers = workers or os.cpu_count() or 1
+        base_seed = random.randrange(2 ** 32) if seed is None else seed
+        seeds = [base_seed + i for i in range(workers)]
+        manager = Manager() if workers > 1 else None
+        pool = ProcessPoolExecutor(workers) if workers > 1 else None
+        
+        try:
+            while target >= 1:
+                if pool is None:
+                    found, iterations = _tabucol(adj, target, max_iterations, seeds[0])
+                    steps += iterations
+                else:
+                    stop = manager.Event()
+                    futures = [pool.submit(_tabucol_worker, adj, target, max_iterations, worker_seed, stop)
+                               for worker_seed in seeds]
+                    found = None
+                    for future in as_completed(futures):
+                        colors, iterations = future.result()
+                        steps += iterations
+                        if found is None and colors is not None:
+                            found = colors
+                
+                if found is None:
+                    break
+                best = found
+                if k is not None:
+                    break
+                target = max(best)
+        finally:
+            if pool is not None:
+                pool.shutdown()
+                manager.shutdown()
+        
+        if best is None:
+            return {}, steps
+        return {node: best[i] for i, node in enumerate(nodes)}, steps
+    
+    def enable_incremental_coloring(self, max_extra_colors=1):
+        self._incremental = {'max_extra_colors': max_extra_colors, 'steps': 0, 'reoptimizations': 0}
+        self._reoptimize_coloring()
+        return self.incremental_coloring()
+    
+    def disable_incremental_coloring(self):
+        self._incremental = None
+    
+    def incremental_coloring(self):
+        state = self._incremental
+        if state is None:
+            return {}, 0
+        return dict(state['coloring']), state['steps']
+    
+    def _reoptimize_coloring(self):
+        state = self._incremental
+        coloring, steps = self.dsatur_coloring()
+        sizes = [0] * (max(coloring.values(), default=-1) + 1)
+        for color in coloring.values():
+            sizes[color] += 1
+        state['coloring'] = coloring
+        state['sizes'] = sizes
+        state['baseline'] = len(sizes)
+        state['steps'] += steps
+        state['reoptimizations'] += 1
+    
+    def _set_color(self, node, color):
+        state = self._incremental
+        sizes = state['sizes']
+        if node in state['coloring']:
+            sizes[state['coloring'][node]] -= 1
+        if color == len(sizes):
+            sizes.append(0)
+        sizes[color] += 1
+        state['coloring'][node] = color
+    
+    def _free_color(self, node, limit=None):
+        coloring = self._incremental['coloring']
+        used = {coloring[neighbor] for neighbor in self.graph[node] if neighbor in coloring}
+        self._incremental['steps'] += len(self.graph[node])
+        color = 0
+        while color in used:
+            color += 1
+        return color if limit is None or color < limit else None
+    
+    def _kempe_recolor(self, node):
+        state = self._incremental
+        coloring = state['coloring']
+        neighbors = self.graph[node]
+        palette = len(state['sizes'])
+        
+        for color in range(palette):
+            starts = [neighbor for neighbor in neighbors if coloring[neighbor] == color]
+            for other in range(palette):
+                if other == color:
+                    continue
+                
+                chain = set(starts)
+                stack = list(starts)
+                blocked = False
+                while stack and not blocked:
+                    x = stack.pop()
+                    state['steps'] += 1
+                    for y in self.graph[x]:
+                        if y == node or y in chain or coloring.get(y) not in (color, other):
+                            continue
+                        if coloring[y] == other and y in neighbors:
+                            blocked = True
+                            break
+                        chain.add(y)
+                        stack.append(y)
+                if blocked:
+                    continue
+                
+                for x in chain:
+                    self._set_color(x, other if coloring[x] == color else color)
+                self._set_color(node, color)
+                return True
+        
+        return False
+    
+    def _repair_coloring(self, u, v):
+        state = self._incremental
+        coloring = state['coloring']
+        for node in (u, v):
             if node not in coloring:
-                coloring[node] = current_color
+                self._set_color(node, self._free_color(node))
+        
+        if u != v and coloring[u] == coloring[v]:
+            endpoints = sorted((u, v), key=lambda node: len(self.graph[node]))
+            for node in endpoints:
+                color = self._free_color(node, len(state['sizes']))
+                if color is not None:
+                    self._set_color(node, color)
+                    break
+            else:
+                if not any(self._kempe_recolor(node) for node in endpoints):
+                    self._set_color(endpoints[0], len(state['sizes']))
+        
+        if sum(1 for size in state['sizes'] if size) > state['baseline'] + state['max_extra_colors']:
+            self._reoptimize_coloring()
+    
+    def chromatic_number(self, tabu_iterations=10000):
+        if not self.graph:
+            return 0, {}, 0
+        
+        nodes, adj = self._index_graph()
+        n = len(nodes)
+        clique = _greedy_clique(adj)
+        lower = len(clique)
+        best_colors, steps_ub = _dsatur(adj)
+        best = [max(best_colors) + 1]
+        steps = [steps_ub]
+        
+        seed = random.randrange(2 ** 32)
+        while best[0] > lower:
+            colors, iterations = _tabucol(adj, best[0] - 1, tabu_iterations, seed)
+            steps[0] += iterations
+            if colors is None:
+                break
+            best_colors = colors
+            best[0] -= 1
+        
+        colors = [-1] * n
+        counts = [[0] * best[0] for _ in range(n)]
+        saturation = [0] * n
+        uncolored_degree = [len(neighbors) for neighbors in adj]
+        uncolored = set(range(n))
+        
+        def assign(v, color):
+            colors[v] = color
+            uncolored.discard(v)
+            feasible = True
+            for u in adj[v]:
+                uncolored_degree[u] -= 1
+                if not counts[u][color]:
+                    saturation[u] += 1
+                    if saturation[u] >= best[0] - 1 and colors[u] < 0:
+                        feasible = False
+                counts[u][color] += 1
+            return feasible
+        
+        def unassign(v, color):
+            colors[v] = -1
+            uncolored.add(v)
+            for u in adj[v]:
+                uncolored_degree[u] += 1
+                counts[u][color] -= 1
+                if not counts[u][color]:
+                    saturation[u] -= 1
+        
+        def most_saturated():
+            return max(uncolored, key=lambda u: (saturation[u], uncolored_degree[u]))
+        
+        if lower < best[0]:
+            for color, v in enumerate(clique):
+                assign(v, color)
+            stack = [(most_saturated(), 0, lower)] if uncolored else []
+            while stack and best[0] > lower:
+                v, color, used = stack[-1]
+                if colors[v] >= 0:
+                    unassign(v, colors[v])
                 
-                independent_set = [node]
-                for other in sorted_nodes:
-                    steps += 1
-                    if other not in coloring:
-                        can_color = True
-                        for colored_node in independent_set:
-                            if other in self.graph[colored_node]:
-                                can_color = False
-                                break
-                        
-                        if can_color:
-                            coloring[other] = current_color
-                            independent_set.append(other)
+                limit = min(used + 1, best[0] - 1)
+                while color < limit and counts[v][color]:
+                    color += 1
+                if color >= limit:
+                    stack.pop()
+                    continue
+                
+                stack[-1] = (v, color + 1, used)
+                steps[0] += 1
+                if not assign(v, color):
+                    continue
+                if not uncolored:
+                    best[0] = max(used, color + 1)
+                    best_colors[:] = colors
+                    continue
+                stack.append((most_saturated(), 0, max(used, color + 1)))
+        
+        return best[0], {node: best_colors[i] for i, node in enumerate(nodes)}, steps[0]
+    
+    def inclusion_exclusion_chromatic_number(self, memmap_path=None):
+        if not self.graph:
+            return 0, 0
+        
+        nodes, adj = self._index_graph()
+        n = len(nodes)
+        if memmap_path is None:
+            counts = np.zeros(1 << n, dtype=np.int64)
+        else:
+            counts = np.memmap(memmap_path, dtype=np.int64, mode='w+', shape=(1 << n,))
+        _independent_sets(adj, counts)
+        _zeta_transform(counts, n)
+        steps = 2 * n * (1 << n)
+        
+        chunk = min(1 << n, INCLUSION_EXCLUSION_CHUNK)
+        low_ranks = _popcounts(chunk.bit_length() - 1).astype(np.int64)
+        weights = {}
+        for start in range(0, 1 << n, chunk):
+            signs = 1 - 2 * ((n - bin(start).count('1') - low_ranks) & 1)
+            values, inverse = np.unique(counts[start:start + chunk], return_inverse=True)
+            signed = np.bincount(inverse.ravel(), weights=signs, minlength=len(values))
+            for value, weight in zip(values.tolist(), signed.astype(np.int64).tolist()):
+                weights[value] = weights.get(value, 0) + weight
+        steps += 1 << n
+        
+        weights = [(value, weight) for value, weight in weights.items() if weight]
+        for k in range(1, n + 1):
+            steps += len(weights)
+            if sum(weight * value ** k for value, weight in weights) > 0:
+                return k, steps
+        
+        return None, steps
+    
+    def count_colorings(self, k, memmap_path=None):
+        if k < 0:
+            return 0, 0
+        if not self.graph:
+            return 1, 0
+        
+        if k == 0:
+            return 0, 0
+        
+        nodes, adj = self._index_graph()
+        n = len(nodes)
+        if n > COUNT_COLORINGS_MAX_VERTICES:
+            raise ValueError(f"count_colorings supports at most {COUNT_COLORINGS_MAX_VERTICES} vertices, got {n}")
+        
+        indicator = np.zeros(1 << n, dtype=np.int8)
+        _independent_sets(adj, indicator)
+        ranks = _popcounts(n)
+        chunk = min(1 << n, INCLUSION_EXCLUSION_CHUNK)
+        alpha = 0
+        for start in range(0, 1 << n, chunk):
+            alpha = max(alpha, int(ranks[start:start + chunk][indicator[start:start + chunk] == 1].max(initial=0)))
+        steps = 1 << n
+        
+        points = k * alpha - n + 1
+        if points <= 0:
+            return 0, steps
+        
+        if memmap_path is None:
+            sums = np.zeros(1 << n, dtype=np.int64)
+        else:
+            sums = np.memmap(memmap_path, dtype=np.int64, mode='w+', shape=(1 << n,))
+        
+        primes = []
+        modulus = 1
+        for prime in _large_primes():
+            primes.append(prime)
+            modulus *= prime
+            if modulus > k ** n:
+                break
+        
+        residues = []
+        for prime in primes:
+            residue = 0
+            binomial = 1
+            for z in range(1, points + 1):
+                binomial = binomial * (points - z + 1) * pow(z, -1, prime) % prime
+                powers = np.array([pow(z, rank, prime) for rank in range(n + 1)], dtype=np.int64)
+                for start in range(0, 1 << n, chunk):
+                    sums[start:start + chunk] = indicator[start:start + chunk] * powers[ranks[start:start + chunk]]
+                _zeta_transform(sums, n)
+                steps += (n + 1) * (1 << n)
                 
-                for colored_node in independent_set:
-                    if colored_node in sorted_nodes:
-                        sorted_nodes.remove(colored_node)
+                total = 0
+                for start in range(0, 1 << n, chunk):
+                    power, products = _power_mod(sums[start:start + chunk] % prime, k, prime)
+                    negative = (n - ranks[start:start + chunk]) & 1 == 1
+                    total += int(power[~negative].sum()) - int(power[negative].sum())
+                    steps += products * len(power)
                 
-                current_color += 1
+                term = binomial * total * pow(z, -n, prime)
+                residue += term if z & 1 else -term
+            residues.append(residue % prime)
         
-        return coloring, steps
+        count = 0
+        modulus = 1
+        for prime, residue in zip(primes, residues):
+            count += modulus * ((residue - count) * pow(modulus, -1, prime) % prime)
+            modulus *= prime
+        
+        return count, steps
+    
+    def _index_graph(self):
+        nodes = list(self.graph.keys())
+        index = {node: i for i, node in enumerate(nodes)}
+        adj = [[index[u] for u in self.graph[node]] for node in nodes]
+        return nodes, adj
     
     def measure_performance(self, k_range=(2, 5), n_nodes=8):
         results = []
@@ -200,6 +942,15 @@ class GraphColoring:
                 'colors_used': len(set(coloring_wp.values())) if coloring_wp else 0
             }
             
+            start_time = time.time()
+            coloring_tabu, steps_tabu = self.tabucol_coloring(workers=1)
+            end_time = time.time()
+            results_item['tabucol'] = {
+                'time': end_time - start_time,
+                'steps': steps_tabu,
+                'colors_used': len(set(coloring_tabu.values())) if coloring_tabu else 0
+            }
+            
             results.append(results_item)
         
         return results
@@ -207,12 +958,7 @@ class GraphColoring:
     def generate_coloring_instance(self, n_nodes, edge_density=0.3):
         self.create_random_graph(n_nodes, edge_density)
         
-        chromatic_number = None
-        for k in range(1, n_nodes + 1):
-            possible, coloring, _ = self.brute_force_coloring(k)
-            if possible:
-                chromatic_number = k
-                break
+        chromatic_number = self.chromatic_number()[0] if n_nodes else None
         
         return {
             'graph': {k: list(v) for k, v in self.graph.items()},
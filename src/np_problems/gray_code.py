@@ -0,0 +1,46 @@
+import numpy as np
+
+BLOCK_BITS = 16
+NUMPY_MIN_ITEMS = 12
+
+def gray_code_flips(n):
+    for step in range(1, 1 << n):
+        index = (step & -step).bit_length() - 1
+        added = bool((step ^ (step >> 1)) >> index & 1)
+        yield index, added
+
+def fits_int64(values):
+    values = np.asarray(values)
+    if values.dtype.kind not in 'iu':
+        return False
+    return float(np.abs(values).sum(dtype=np.float64)) < 2.0 ** 62
+
+def subset_sums(numbers):
+    sums = np.zeros(1 << len(numbers), dtype=np.int64 if fits_int64(numbers) else object)
+    for j, num in enumerate(numbers):
+        width = 1 << j
+        sums[width:2 * width] = sums[:width] + num
+    return sums
+
+def subset_sum_blocks(columns, block_bits=BLOCK_BITS):
+    columns = np.asarray(columns, dtype=np.int64).reshape(-1, np.shape(columns)[-1])
+    n = columns.shape[1]
+    low_bits = min(block_bits, n)
+    
+    low = np.zeros((columns.shape[0], 1 << low_bits), dtype=np.int64)
+    for j in range(low_bits):
+        width = 1 << j
+        low[:, width:2 * width] = low[:, :width] + columns[:, j:j + 1]
+    
+    high = np.zeros(columns.shape[0], dtype=np.int64)
+    high_mask = 0
+    yield 0, low
+    
+    for index, added in gray_code_flips(n - low_bits):
+        item = low_bits + index
+        if added:
+            high += columns[:, item]
+        else:
+            high -= columns[:, item]
+        high_mask ^= 1 << item
+        yield high_mask, low + high[:, None]
@@ -1,124 +1,708 @@
 import itertools
 import random
 import time
+from bisect import bisect_right
+from fractions import Fraction
 from typing import List, Tuple, Dict
+import numpy as np
+from .gray_code import NUMPY_MIN_ITEMS, fits_int64, gray_code_flips, subset_sum_blocks
+
+_INT64_MAX = np.iinfo(np.int64).max
+
+def _dp_dtype(values):
+    values = np.asarray(values)
+    if values.dtype.kind == 'f':
+        return np.float64
+    if values.dtype == object or not fits_int64(values[values > 0]):
+        return object
+    return np.int64
+
+def _dp_row_update(row, weight, value, take=None):
+    capacity = len(row) - 1
+    if weight > capacity:
+        return False
+    
+    candidate = row[:capacity + 1 - weight] + value
+    if take is not None:
+        take[:weight] = False
+        np.greater(candidate, row[weight:], out=take[weight:])
+    np.maximum(row[weight:], candidate, out=row[weight:])
+    return True
+
+def _branch_and_bound(weights, values, capacity):
+    forced = [i for i in range(len(weights)) if weights[i] == 0 and values[i] > 0]
+    order = [i for i in range(len(weights)) if 0 < weights[i] <= capacity and values[i] > 0]
+    integral = all(isinstance(values[i], (int, np.integer)) and isinstance(weights[i], (int, np.integer)) for i in order)
+    if integral:
+        order.sort(key=lambda i: Fraction(int(values[i]), int(weights[i])), reverse=True)
+    else:
+        order.sort(key=lambda i: values[i] / weights[i], reverse=True)
+    w = [weights[i] for i in order]
+    v = [values[i] for i in order]
+    n = len(order)
+    
+    prefix_w = [0] * (n + 1)
+    prefix_v = [0] * (n + 1)
+    for j in range(n):
+        prefix_w[j + 1] = prefix_w[j] + w[j]
+        prefix_v[j + 1] = prefix_v[j] + v[j]
+    
+    best_value = 0
+    best_mask = 0
+    room = capacity
+    for j in range(n):
+        if w[j] <= room:
+            room -= w[j]
+            best_value += v[j]
+            best_mask |= 1 << j
+    
+    def upper_bound(level, room, value):
+        j = bisect_right(prefix_w, prefix_w[level] + room, level, n + 1) - 1
+        bound = value + prefix_v[j] - prefix_v[level]
+        if j < n:
+            if integral:
+                bound += (room - prefix_w[j] + prefix_w[level]) * v[j] // w[j]
+            else:
+                bound += (room - prefix_w[j] + prefix_w[level]) * v[j] / w[j]
+        return bound
+    
+    nodes = 0
+    stack = [(0, capacity, 0, 0)]
+    while stack:
+        level, room, value, mask = stack.pop()
+        nodes += 1
+        
+        if value > best_value:
+            best_value = value
+            best_mask = mask
+        if level == n or upper_bound(level, room, value) <= best_value:
+            continue
+        
+        stack.append((level + 1, room, value, mask))
+        if w[level] <= room:
+            stack.append((level + 1, room - w[level], value + v[level], mask | (1 << level)))
+    
+    chosen = forced + [order[j] for j in range(n) if best_mask >> j & 1]
+    chosen.sort()
+    return chosen, nodes
+
+def _break_solution(weights, values, capacity):
+    density = values / weights
+    in_break = np.zeros(len(weights), dtype=bool)
+    candidates = np.arange(len(weights))
+    room = capacity
+    scanned = 0
+    
+    while True:
+        scanned += len(candidates)
+        mid = len(candidates) // 2
+        pivot = np.partition(density[candidates], mid)[mid]
+        higher = candidates[density[candidates] > pivot]
+        equal = candidates[density[candidates] == pivot]
+        
+        higher_weight = weights[higher].sum()
+        if higher_weight > room:
+            candidates = higher
+            continue
+        in_break[higher] = True
+        room -= higher_weight
+        
+        fits = np.cumsum(weights[equal]) <= room
+        if not fits.all():
+            split = int(np.argmin(fits))
+            in_break[equal[:split]] = True
+            room -= weights[equal[:split]].sum()
+            return in_break, int(equal[split]), room, scanned
+        in_break[equal] = True
+        room -= weights[equal].sum()
+        candidates = candidates[density[candidates] < pivot]
+
+def _dantzig_bound(weights, values, capacity):
+    with np.errstate(divide='ignore'):
+        density = values / weights
+    order = np.argsort(-density, kind='stable')
+    cumulative_weight = np.cumsum(weights[order])
+    cumulative_value = np.cumsum(values[order])
+    
+    fits = int(np.searchsorted(cumulative_weight, capacity, side='right'))
+    if fits == len(order):
+        return cumulative_value[-1], float(cumulative_value[-1])
+    
+    room = capacity - (cumulative_weight[fits - 1] if fits else 0)
+    prefix_value = cumulative_value[fits - 1] if fits else 0
+    return prefix_value, float(prefix_value + room * density[order[fits]])
 
 class KnapsackSolver:
     
     def __init__(self):
-        self.items = []
+        self.names = []
+        self._weights = np.zeros(16, dtype=np.int64)
+        self._values = np.zeros(16, dtype=np.int64)
+        self._counts = np.ones(16, dtype=np.int64)
+        self._size = 0
+        self._epoch = 0
+        self._dp_state = None
+    
+    @property
+    def weights(self):
+        return self._read_only(self._weights)
+    
+    @property
+    def values(self):
+        return self._read_only(self._values)
+    
+    @property
+    def counts(self):
+        return self._read_only(self._counts)
+    
+    @property
+    def items(self):
+        return tuple(self._item_views(range(self._size)))
+    
+    @items.setter
+    def items(self, items):
+        self.names = []
+        self._weights = np.zeros(16, dtype=np.int64)
+        self._values = np.zeros(16, dtype=np.int64)
+        self._counts = np.ones(16, dtype=np.int64)
+        self._size = 0
+        self._epoch += 1
+        for item in items:
+            self.add_item(item['name'], item['weight'], item['value'], item.get('count', 1))
+    
+    def add_item(self, name, weight, value, count=1):
+        self._weights = self._append(self._weights, weight)
+        self._values = self._append(self._values, value)
+        self._counts = self._append(self._counts, count)
+        self.names.append(name)
+        self._size += 1
+    
+    def remove_item(self, index):
+        index = range(self._size)[index]
+        removed = self._item_views([index])[0]
+        
+        self._weights[index:self._size - 1] = self._weights[index + 1:self._size]
+        self._values[index:self._size - 1] = self._values[index + 1:self._size]
+        self._counts[index:self._size - 1] = self._counts[index + 1:self._size]
+        self.names.pop(index)
+        self._size -= 1
+        self._epoch += 1
+        return removed
+    
+    def reorder_items(self, order):
+        order = np.asarray(order, dtype=np.int64)
+        if sorted(order.tolist()) != list(range(self._size)):
+            raise ValueError("order must be a permutation of the item indices")
+        
+        self._weights[:self._size] = self.weights[order]
+        self._values[:self._size] = self.values[order]
+        self._counts[:self._size] = self.counts[order]
+        self.names = [self.names[i] for i in order.tolist()]
+        self._epoch += 1
+    
+    def _append(self, buffer, value):
+        if isinstance(value, (float, np.floating)) and buffer.dtype.kind == 'i':
+            buffer = buffer.astype(np.float64)
+        elif buffer.dtype.kind == 'i' and not fits_int64([value]):
+            buffer = buffer.astype(object)
+        
+        if self._size == len(buffer):
+            buffer = np.concatenate([buffer, np.ones_like(buffer)])
+        buffer[self._size] = value
+        return buffer
+    
+    def _read_only(self, buffer):
+        view = buffer[:self._size]
+        view.flags.writeable = False
+        return view
+    
+    def _item_views(self, indices):
+        indices = list(indices)
+        weights = self._weights[indices].tolist()
+        values = self._values[indices].tolist()
+        views = [{'name': self.names[i], 'weight': weight, 'value': value}
+                 for i, weight, value in zip(indices, weights, values)]
+        for view, count in zip(views, self._counts[indices].tolist()):
+            if count != 1:
+                view['count'] = count
+        return views
     
-    def add_item(self, name, weight, value):
-        self.items.append({'name': name, 'weight': weight, 'value': value})
+    def _selection(self, chosen):
+        selected = self._item_views(chosen)
+        total_value = sum(item['value'] for item in selected)
+        total_weight = sum(item['weight'] for item in selected)
+        return selected, total_value, total_weight
     
     def create_random_items(self, n_items=10, max_weight=50, max_value=100):
         self.items = []
         for i in range(n_items):
             weight = random.randint(1, max_weight)
             value = random.randint(1, max_value)
-            self.items.append({
-                'name': f'Item_{i}',
-                'weight': weight,
-                'value': value
-            })
+            self.add_item(f'Item_{i}', weight, value)
         return self.items
     
     def brute_force_knapsack(self, capacity):
-        if not self.items:
+        if not self._size:
             return [], 0, 0, 0
         
-        n = len(self.items)
+        n = self._size
+        weights = self.weights
+        values = self.values
         best_value = 0
         best_combination = None
         steps = 0
         
-        for i in range(1 << n):
-            steps += 1
+        if n >= NUMPY_MIN_ITEMS and fits_int64(weights) and fits_int64(values):
+            for base, (total_weights, total_values) in subset_sum_blocks([weights, values]):
+                steps += len(total_values)
+                candidates = np.where(total_weights <= capacity, total_values, -1)
+                best = int(np.argmax(candidates))
+                if candidates[best] > best_value:
+                    best_value = int(candidates[best])
+                    best_combination = base | best
+        else:
+            weights = weights.tolist()
+            values = values.tolist()
             total_weight = 0
             total_value = 0
-            
-            for j in range(n):
-                if i & (1 << j):
-                    total_weight += self.items[j]['weight']
-                    total_value += self.items[j]['value']
-            
+            mask = 0
+            steps += 1
             if total_weight <= capacity and total_value > best_value:
                 best_value = total_value
-                best_combination = i
+                best_combination = mask
+            
+            for j, added in gray_code_flips(n):
+                steps += 1
+                sign = 1 if added else -1
+                total_weight += sign * weights[j]
+                total_value += sign * values[j]
+                mask ^= 1 << j
+                
+                if total_weight <= capacity and total_value > best_value:
+                    best_value = total_value
+                    best_combination = mask
         
         if best_combination is not None:
-            selected_items = []
-            for j in range(n):
-                if best_combination & (1 << j):
-                    selected_items.append(self.items[j])
-            return selected_items, best_value, sum(item['weight'] for item in selected_items), steps
+            chosen = [j for j in range(n) if best_combination & (1 << j)]
+            selected_items, best_value, total_weight = self._selection(chosen)
+            return selected_items, best_value, total_weight, steps
         
         return [], 0, 0, steps
     
     def greedy_by_value(self, capacity):
-        sorted_items = sorted(self.items, key=lambda x: x['value'], reverse=True)
-        
-        total_weight = 0
-        total_value = 0
-        selected = []
-        steps = 0
-        
-        for item in sorted_items:
-            steps += 1
-            if total_weight + item['weight'] <= capacity:
-                selected.append(item)
-                total_weight += item['weight']
-                total_value += item['value']
-        
-        return selected, total_value, total_weight, steps
+        order = np.argsort(-self.values, kind='stable')
+        return self._greedy_fill(order, capacity)
     
     def greedy_by_value_density(self, capacity):
-        sorted_items = sorted(self.items, key=lambda x: x['value'] / x['weight'], reverse=True)
-        
+        with np.errstate(divide='ignore'):
+            density = self.values / self.weights
+        order = np.argsort(-density, kind='stable')
+        return self._greedy_fill(order, capacity)
+    
+    def _greedy_fill(self, order, capacity):
+        weights = self.weights.tolist()
         total_weight = 0
-        total_value = 0
-        selected = []
+        chosen = []
         steps = 0
         
-        for item in sorted_items:
+        for i in order.tolist():
             steps += 1
-            if total_weight + item['weight'] <= capacity:
-                selected.append(item)
-                total_weight += item['weight']
-                total_value += item['value']
+            if total_weight + weights[i] <= capacity:
+                chosen.append(i)
+                total_weight += weights[i]
         
+        selected, total_value, total_weight = self._selection(chosen)
         return selected, total_value, total_weight, steps
     
     def dynamic_programming_knapsack(self, capacity):
-        n = len(self.items)
-        weights = [item['weight'] for item in self.items]
-        values = [item['value'] for item in self.items]
+        if capacity < 0:
+            return [], 0, 0, 0
         
-        dp = [[0] * (capacity + 1) for _ in range(n + 1)]
-        steps = 0
+        n = self._size
+        weights = self.weights
+        values = self.values
         
+        dp = np.zeros((n + 1, capacity + 1), dtype=_dp_dtype(values))
         for i in range(1, n + 1):
-            for w in range(capacity + 1):
-                steps += 1
-                if weights[i-1] <= w:
-                    dp[i][w] = max(dp[i-1][w], dp[i-1][w-weights[i-1]] + values[i-1])
-                else:
-                    dp[i][w] = dp[i-1][w]
+            dp[i] = dp[i - 1]
+            _dp_row_update(dp[i], weights[i - 1], values[i - 1])
+        steps = n * (capacity + 1)
         
         w = capacity
-        selected = []
+        chosen = []
         for i in range(n, 0, -1):
             steps += 1
             if dp[i][w] != dp[i-1][w]:
-                selected.append(self.items[i-1])
+                chosen.append(i - 1)
                 w -= weights[i-1]
         
-        selected.reverse()
-        total_value = dp[n][capacity]
-        total_weight = sum(item['weight'] for item in selected)
+        chosen.reverse()
+        selected, total_value, total_weight = self._selection(chosen)
         
         return selected, total_value, total_weight, steps
     
+    def branch_and_bound_knapsack(self, capacity):
+        if capacity < 0 or not self._size:
+            return [], 0, 0, 0
+        
+        chosen, steps = _branch_and_bound(self.weights.tolist(), self.values.tolist(), capacity)
+        selected, total_value, total_weight = self._selection(chosen)
+        
+        return selected, total_value, total_weight, steps
+    
+    def core_knapsack(self, capacity, core_size=64):
+        if capacity < 0 or not self._size:
+            return [], 0, 0, 0
+        
+        forced = np.flatnonzero((self.weights == 0) & (self.values > 0)).tolist()
+        index = np.flatnonzero((self.weights > 0) & (self.weights <= capacity) & (self.values > 0))
+        weights = self.weights[index]
+        values = self.values[index]
+        n = len(index)
+        
+        if weights.sum() <= capacity:
+            chosen = forced + index.tolist()
+            steps = n
+        else:
+            in_break, break_item, room, steps = _break_solution(weights, values, capacity)
+            ratio = values[break_item] / weights[break_item]
+            upper = values[in_break].sum() + room * ratio
+            gaps = np.abs(values - ratio * weights)
+            integral = values.dtype.kind != 'f'
+            slack = 1e-9 * max(1.0, abs(upper)) - (1 if integral else 0)
+            steps += n
+            
+            size = min(core_size, n)
+            while True:
+                core = np.zeros(n, dtype=bool)
+                core[np.argpartition(gaps, size - 1)[:size]] = True
+                fixed = in_break & ~core
+                residual = capacity - int(weights[fixed].sum())
+                core_items = np.flatnonzero(core)
+                
+                core_chosen, nodes = _branch_and_bound(weights[core_items].tolist(),
+                                                       values[core_items].tolist(), residual)
+                steps += nodes
+                best = sum(values[fixed].tolist()) + sum(values[core_items[core_chosen]].tolist())
+                
+                needed = int(np.count_nonzero(upper - gaps > best - slack))
+                if needed <= size or size == n:
+                    break
+                size = min(n, max(needed, 2 * size))
+            
+            chosen = forced + index[fixed].tolist() + index[core_items[core_chosen]].tolist()
+        
+        chosen.sort()
+        selected, total_value, total_weight = self._selection(chosen)
+        
+        return selected, total_value, total_weight, steps
+    
+    def pareto_knapsack(self, capacity):
+        if capacity < 0 or not self._size:
+            return [], 0, 0, 0
+        
+        weights = self.weights
+        values = self.values
+        front_weights = np.zeros(1, dtype=weights.dtype)
+        front_values = np.zeros(1, dtype=values.dtype)
+        history = []
+        steps = 0
+        
+        for i in range(self._size):
+            fits = np.searchsorted(front_weights, capacity - weights[i], side='right')
+            shifted_weights = front_weights[:fits] + weights[i]
+            shifted_values = front_values[:fits] + values[i]
+            
+            size = len(front_weights) + fits
+            is_new = np.zeros(size, dtype=bool)
+            is_new[np.searchsorted(front_weights, shifted_weights) + np.arange(fits)] = True
+            merged_weights = np.empty(size, dtype=weights.dtype)
+            merged_values = np.empty(size, dtype=values.dtype)
+            parents = np.empty(size, dtype=np.int64)
+            merged_weights[is_new] = shifted_weights
+            merged_weights[~is_new] = front_weights
+            merged_values[is_new] = shifted_values
+            merged_values[~is_new] = front_values
+            parents[is_new] = np.arange(fits)
+            parents[~is_new] = np.arange(len(front_weights))
+            steps += size
+            
+            keep = np.ones(size, dtype=bool)
+            keep[1:] = merged_values[1:] > np.maximum.accumulate(merged_values)[:-1]
+            keep = np.flatnonzero(keep)
+            kept_weights = merged_weights[keep]
+            keep = keep[np.append(kept_weights[1:] != kept_weights[:-1], True)]
+            
+            front_weights = merged_weights[keep]
+            front_values = merged_values[keep]
+            history.append((parents[keep], is_new[keep]))
+        
+        chosen = []
+        state = len(front_weights) - 1
+        for i in range(self._size - 1, -1, -1):
+            parents, took = history[i]
+            if took[state]:
+                chosen.append(i)
+            state = parents[state]
+        
+        chosen.reverse()
+        selected, total_value, total_weight = self._selection(chosen)
+        
+        return selected, total_value, total_weight, steps
+    
+    def fptas_knapsack(self, capacity, epsilon=0.1):
+        if not 0 < epsilon < 1:
+            raise ValueError("epsilon must be between 0 and 1")
+        
+        index = np.flatnonzero((self.weights <= capacity) & (self.values > 0))
+        if capacity < 0 or not len(index):
+            return [], 0, 0, 0, 0
+        
+        weights = self.weights[index]
+        values = self.values[index]
+        n = len(index)
+        prefix_value, upper = _dantzig_bound(weights, values, capacity)
+        lower = max(prefix_value, values.max())
+        
+        scale = epsilon * float(lower) / n
+        exact = values.dtype.kind != 'f' and scale <= 1
+        if exact:
+            scale = 1
+            profits = values.astype(np.int64)
+        else:
+            profits = np.floor(values / scale).astype(np.int64)
+        max_profit = min(int(profits.sum()), int(upper / scale))
+        
+        sentinel = capacity + 1
+        min_weight = np.full(max_profit + 1, sentinel, dtype=_dp_dtype(weights))
+        min_weight[0] = 0
+        take = np.zeros(max_profit + 1, dtype=bool)
+        bits = np.zeros((n, (max_profit + 8) // 8), dtype=np.uint8)
+        
+        for i in range(n):
+            profit = profits[i]
+            if profit == 0 or profit > max_profit:
+                continue
+            candidate = min_weight[:max_profit + 1 - profit] + weights[i]
+            take[:profit] = False
+            np.less(candidate, min_weight[profit:], out=take[profit:])
+            np.minimum(min_weight[profit:], candidate, out=min_weight[profit:])
+            bits[i] = np.packbits(take)
+        steps = n * (max_profit + 1) + n
+        
+        best_profit = int(np.flatnonzero(min_weight <= capacity)[-1])
+        chosen = index[self._walk_take_bits(bits, profits, best_profit)]
+        selected, total_value, total_weight = self._selection(chosen)
+        
+        if exact:
+            bound = total_value
+        else:
+            bound = min(upper, total_value + n * scale)
+        
+        return selected, total_value, total_weight, steps, bound
+    
+    def bounded_knapsack(self, capacity):
+        if capacity < 0 or not self._size:
+            return [], 0, 0, 0
+        
+        weights = self.weights
+        values = self.values
+        counts = np.where(weights > 0, np.minimum(self.counts, capacity // np.maximum(weights, 1)), self.counts)
+        owners = []
+        sizes = []
+        for i in np.flatnonzero(counts > 0).tolist():
+            remaining = int(counts[i])
+            size = 1
+            while remaining > 0:
+                size = min(size, remaining)
+                owners.append(i)
+                sizes.append(size)
+                remaining -= size
+                size *= 2
+        
+        owners = np.array(owners, dtype=np.int64)
+        sizes = np.array(sizes, dtype=np.int64)
+        bundle_values = np.array([value * size for value, size in zip(values[owners].tolist(), sizes.tolist())])
+        bundle_values = bundle_values.astype(_dp_dtype(bundle_values))
+        chosen, steps = self._bitmatrix_knapsack(weights[owners] * sizes, bundle_values, capacity)
+        
+        quantities = np.zeros(self._size, dtype=np.int64)
+        np.add.at(quantities, owners[chosen], sizes[chosen])
+        picked = np.flatnonzero(quantities)
+        selected = self._item_views(picked.tolist())
+        for item, quantity in zip(selected, quantities[picked].tolist()):
+            item['count'] = quantity
+        total_value = sum(item['value'] * item['count'] for item in selected)
+        total_weight = sum(item['weight'] * item['count'] for item in selected)
+        
+        return selected, total_value, total_weight, steps
+    
+    def compact_dynamic_programming_knapsack(self, capacity, max_bitmatrix_bytes=1 << 28):
+        if capacity < 0 or not self._size:
+            return [], 0, 0, 0
+        
+        n = self._size
+        weights = self.weights
+        values = self.values
+        row_bytes = (capacity + 8) // 8
+        
+        if n * row_bytes <= max_bitmatrix_bytes:
+            chosen, steps = self._bitmatrix_knapsack(weights, values, capacity)
+        else:
+            steps = [0]
+            chosen = []
+            
+            def solve(lo, hi, cap):
+                if hi - lo == 1:
+                    steps[0] += 1
+                    if weights[lo] <= cap and values[lo] > 0:
+                        chosen.append(lo)
+                    return
+                
+                mid = (lo + hi) // 2
+                left = self._value_row(weights[lo:mid], values[lo:mid], cap)
+                right = self._value_row(weights[mid:hi], values[mid:hi], cap)
+                steps[0] += (hi - lo) * (cap + 1)
+                split = int(np.argmax(left + right[::-1]))
+                del left, right
+                solve(lo, mid, split)
+                solve(mid, hi, cap - split)
+            
+            solve(0, n, capacity)
+            chosen.sort()
+            steps = steps[0]
+        
+        selected, total_value, total_weight = self._selection(chosen)
+        
+        return selected, total_value, total_weight, steps
+    
+    def _value_row(self, weights, values, capacity):
+        row = np.zeros(capacity + 1, dtype=_dp_dtype(values))
+        for weight, value in zip(weights, values):
+            _dp_row_update(row, weight, value)
+        return row
+    
+    def _bitmatrix_knapsack(self, weights, values, capacity):
+        n = len(weights)
+        row = np.zeros(capacity + 1, dtype=_dp_dtype(values))
+        take = np.zeros(capacity + 1, dtype=bool)
+        bits = np.zeros((n, (capacity + 8) // 8), dtype=np.uint8)
+        steps = n * (capacity + 1)
+        
+        for i in range(n):
+            if _dp_row_update(row, weights[i], values[i], take):
+                bits[i] = np.packbits(take)
+        
+        return self._walk_take_bits(bits, weights, capacity), steps + n
+    
+    def _walk_take_bits(self, bits, weights, capacity):
+        chosen = []
+        w = capacity
+        for i in range(len(bits) - 1, -1, -1):
+            if (bits[i][w >> 3] >> (7 - (w & 7))) & 1:
+                chosen.append(i)
+                w -= weights[i]
+        
+        chosen.reverse()
+        return chosen
+    
+    def _extend_dp_state(self, capacity):
+        state = self._dp_state
+        if (state is None or state['epoch'] != self._epoch or state['capacity'] < capacity
+                or state['count'] > self._size):
+            state = {
+                'epoch': self._epoch,
+                'capacity': capacity,
+                'count': 0,
+                'row': np.zeros(capacity + 1, dtype=np.int64),
+                'bits': [],
+                'selections': {}
+            }
+            self._dp_state = state
+        
+        if state['count'] == self._size:
+            return state, 0
+        
+        dtype = _dp_dtype(self.values)
+        if state['row'].dtype != dtype:
+            state['row'] = state['row'].astype(dtype)
+        
+        row = state['row']
+        take = np.zeros(len(row), dtype=bool)
+        empty = np.zeros((len(row) + 7) // 8, dtype=np.uint8)
+        for i in range(state['count'], self._size):
+            if _dp_row_update(row, self._weights[i], self._values[i], take):
+                state['bits'].append(np.packbits(take))
+            else:
+                state['bits'].append(empty)
+        
+        steps = (self._size - state['count']) * len(row)
+        state['count'] = self._size
+        state['selections'] = {}
+        return state, steps
+    
+    def incremental_knapsack(self, capacity):
+        if capacity < 0:
+            return [], 0, 0, 0
+        
+        state, steps = self._extend_dp_state(capacity)
+        if capacity not in state['selections']:
+            state['selections'][capacity] = self._walk_take_bits(state['bits'], self.weights, capacity)
+            steps += self._size
+        
+        selected, total_value, total_weight = self._selection(state['selections'][capacity])
+        return selected, total_value, total_weight, steps
+    
+    def solve_all_capacities(self, max_capacity):
+        state, _ = self._extend_dp_state(max_capacity)
+        return state['row'][:max_capacity + 1].copy()
+    
+    def reconstruct_capacity(self, capacity):
+        selected, total_value, total_weight, _ = self.incremental_knapsack(capacity)
+        return selected, total_value, total_weight, self._size
+    
+    def solve_batch(self, instances):
+        results = [([], 0, 0, 0) for _ in instances]
+        buckets = {}
+        for k, instance in enumerate(instances):
+            if instance['capacity'] >= 0 and instance['items']:
+                buckets.setdefault(int(instance['capacity']).bit_length(), []).append(k)
+        
+        for members in buckets.values():
+            capacities = np.array([instances[k]['capacity'] for k in members])
+            counts = [len(instances[k]['items']) for k in members]
+            width = max(counts)
+            bucket_values = [item['value'] for k in members for item in instances[k]['items']]
+            weights = np.zeros((len(members), width), dtype=np.int64)
+            values = np.zeros((len(members), width), dtype=_dp_dtype(bucket_values))
+            for row, k in enumerate(members):
+                items = instances[k]['items']
+                weights[row, :counts[row]] = [item['weight'] for item in items]
+                values[row, :counts[row]] = [item['value'] for item in items]
+            
+            columns = np.arange(capacities.max() + 1)
+            dp = np.zeros((len(members), len(columns)), dtype=_dp_dtype(values))
+            bits = []
+            for j in range(width):
+                source = columns - weights[:, j:j + 1]
+                candidate = np.take_along_axis(dp, np.maximum(source, 0), axis=1) + values[:, j:j + 1]
+                take = (source >= 0) & (candidate > dp)
+                dp = np.where(take, candidate, dp)
+                bits.append(np.packbits(take, axis=1))
+            
+            for row, k in enumerate(members):
+                items = instances[k]['items']
+                capacity = int(capacities[row])
+                chosen = self._walk_take_bits([bits[j][row] for j in range(counts[row])],
+                                              weights[row].tolist(), capacity)
+                selected = [items[i] for i in chosen]
+                results[k] = (selected,
+                              sum(item['value'] for item in selected),
+                              sum(item['weight'] for item in selected),
+                              counts[row] * (capacity + 1) + counts[row])
+        
+        return results
+    
     def measure_performance(self, n_items_range=(5, 20), capacity=50):
         results = []
         
@@ -1,7 +1,12 @@
 import itertools
 import random
 import time
+import heapq
 from typing import List, Tuple
+import numpy as np
+from .gray_code import NUMPY_MIN_ITEMS, fits_int64, gray_code_flips, subset_sum_blocks, subset_sums
+
+BALANCED_RATIO = 2048
 
 class SubsetSum:
     
@@ -19,59 +24,103 @@ class SubsetSum:
         n = len(self.numbers)
         steps = 0
         
-        for i in range(1 << n):
-            steps += 1
-            current_sum = 0
-            subset = []
+        if n >= NUMPY_MIN_ITEMS and fits_int64(self.numbers):
+            for base, (sums,) in subset_sum_blocks([self.numbers]):
+                hits = np.flatnonzero(sums == target)
+                if len(hits):
+                    steps += int(hits[0]) + 1
+                    mask = base | int(hits[0])
+                    subset = [self.numbers[j] for j in range(n) if mask >> j & 1]
+                    return True, subset, steps
+                steps += len(sums)
             
-            for j in range(n):
-                if i & (1 << j):
-                    current_sum += self.numbers[j]
-                    subset.append(self.numbers[j])
+            return False, [], steps
+        
+        current_sum = 0
+        mask = 0
+        steps += 1
+        if current_sum == target:
+            return True, [], steps
+        
+        for j, added in gray_code_flips(n):
+            steps += 1
+            current_sum += self.numbers[j] if added else -self.numbers[j]
+            mask ^= 1 << j
             
             if current_sum == target:
+                subset = [self.numbers[i] for i in range(n) if mask >> i & 1]
                 return True, subset, steps
         
         return False, [], steps
     
-    def meet_in_the_middle(self, target):
+    def meet_in_the_middle(self, target, chunk_size=1 << 20):
         n = len(self.numbers)
         if n == 0:
             return False, [], 0
         
-        steps = 0
-        
-        left = self.numbers[:n//2]
-        right = self.numbers[n//2:]
+        half = n // 2
+        left_sums = subset_sums(self.numbers[:half])
+        right_sums = subset_sums(self.numbers[half:])
+        right_masks = np.argsort(right_sums, kind='stable')
+        right_sums = right_sums[right_masks]
+        steps = n
         
-        left_sums = {0: []}
-        for i in range(len(left)):
-            new_sums = {}
-            steps += 1
-            for s, subset in left_sums.items():
-                new_sum = s + left[i]
-                new_subsets = subset + [left[i]]
-                new_sums[new_sum] = new_subsets
+        for start in range(0, len(left_sums), chunk_size):
+            needed = target - left_sums[start:start + chunk_size]
+            positions = np.minimum(np.searchsorted(right_sums, needed), len(right_sums) - 1)
+            hits = np.flatnonzero(right_sums[positions] == needed)
             
-            left_sums.update(new_sums)
+            if len(hits):
+                steps += int(hits[0]) + 1
+                mask = (start + int(hits[0])) | (int(right_masks[positions[hits[0]]]) << half)
+                subset = [self.numbers[j] for j in range(n) if mask >> j & 1]
+                return True, subset, steps
+            steps += len(needed)
         
-        right_sums = {0: []}
-        for i in range(len(right)):
-            new_sums = {}
-            steps += 1
-            for s, subset in right_sums.items():
-                new_sum = s + right[i]
-                new_subsets = subset + [right[i]]
-                new_sums[new_sum] = new_subsets
-            
-            right_sums.update(new_sums)
+        return False, [], steps
+    
+    def schroeppel_shamir(self, target):
+        n = len(self.numbers)
+        bounds = [0, n // 4, n // 2, (3 * n) // 4, n]
+        sums = []
+        masks = []
+        for q in range(4):
+            quarter_sums = subset_sums(self.numbers[bounds[q]:bounds[q + 1]])
+            order = np.argsort(quarter_sums, kind='stable')
+            sums.append(quarter_sums[order].tolist())
+            masks.append(order)
+        a_sums, b_sums, c_sums, d_sums = sums
+        
+        low_heap = [(a + b_sums[0], i, 0) for i, a in enumerate(a_sums)]
+        high_heap = [(-(c + d_sums[-1]), i, len(d_sums) - 1) for i, c in enumerate(c_sums)]
+        heapq.heapify(low_heap)
+        heapq.heapify(high_heap)
+        steps = 0
         
-        for left_sum, left_subset in left_sums.items():
+        while low_heap and high_heap:
             steps += 1
-            needed = target - left_sum
-            if needed in right_sums:
-                full_subset = left_subset + right_sums[needed]
-                return True, full_subset, steps
+            low, a, b = low_heap[0]
+            high, c, d = high_heap[0]
+            total = low - high
+            
+            if total == target:
+                picks = [int(masks[0][a]), int(masks[1][b]), int(masks[2][c]), int(masks[3][d])]
+                subset = []
+                for q, pick in enumerate(picks):
+                    subset.extend(self.numbers[bounds[q] + j] for j in range(bounds[q + 1] - bounds[q])
+                                  if pick >> j & 1)
+                return True, subset, steps
+            
+            if total < target:
+                if b + 1 < len(b_sums):
+                    heapq.heapreplace(low_heap, (a_sums[a] + b_sums[b + 1], a, b + 1))
+                else:
+                    heapq.heappop(low_heap)
+            else:
+                if d > 0:
+                    heapq.heapreplace(high_heap, (-(c_sums[c] + d_sums[d - 1]), c, d - 1))
+                else:
+                    heapq.heappop(high_heap)
         
         return False, [], steps
     
@@ -79,28 +128,234 @@ class SubsetSum:
         n = len(self.numbers)
         dp = [False] * (target + 1)
         dp[0] = True
+        first = [-1] * (target + 1)
         steps = 0
         
-        for num in self.numbers:
+        for idx, num in enumerate(self.numbers):
             steps += 1
             for i in range(target, num - 1, -1):
                 steps += 1
-                if dp[i - num]:
+                if dp[i - num] and not dp[i]:
                     dp[i] = True
+                    first[i] = idx
         
         if not dp[target]:
             return False, [], steps
         
         subset = []
         remaining = target
-        for i in range(n - 1, -1, -1):
+        while remaining > 0:
             steps += 1
-            if remaining >= self.numbers[i] and dp[remaining - self.numbers[i]]:
-                subset.append(self.numbers[i])
-                remaining -= self.numbers[i]
+            num = self.numbers[first[remaining]]
+            subset.append(num)
+            remaining -= num
         
         return True, subset, steps
     
+    def bitset_subset_sum(self, target, engine='auto'):
+        if target < 0:
+            return False, [], 0
+        
+        if engine == 'auto':
+            engine = 'int'
+            if self.numbers and min(self.numbers) >= 0 and max(self.numbers) * BALANCED_RATIO <= target:
+                engine = 'balanced'
+        
+        if engine == 'balanced':
+            return self.balanced_subset_sum(target)
+        elif engine == 'int':
+            rows = self._bitset_rows(target)
+            steps = len(self.numbers)
+            if not rows[-1] >> target & 1:
+                return False, [], steps
+            
+            chosen = []
+            remaining = target
+            for i in range(len(self.numbers) - 1, -1, -1):
+                steps += 1
+                if not rows[i] >> remaining & 1:
+                    chosen.append(i)
+                    remaining -= self.numbers[i]
+        elif engine == 'numpy':
+            first, steps = self._bitset_first_reaching(target)
+            if target and first[target] < 0:
+                return False, [], steps
+            
+            chosen = []
+            remaining = target
+            while remaining > 0:
+                steps += 1
+                chosen.append(int(first[remaining]))
+                remaining -= self.numbers[chosen[-1]]
+        else:
+            raise ValueError(f"Unknown engine: {engine}")
+        
+        chosen.sort()
+        return True, [self.numbers[i] for i in chosen], steps
+    
+    def balanced_subset_sum(self, target):
+        if target < 0:
+            return False, [], 0
+        
+        items = [i for i, num in enumerate(self.numbers) if num > 0]
+        weights = [self.numbers[i] for i in items]
+        n = len(weights)
+        steps = 0
+        
+        prefix = 0
+        b = 0
+        while b < n and prefix + weights[b] <= target:
+            prefix += weights[b]
+            b += 1
+        if b == n:
+            if prefix != target:
+                return False, [], n
+            return True, [self.numbers[i] for i in items], n
+        
+        r = max(weights)
+        low = target - r + 1
+        s = [0] * r + [1] * r
+        s[prefix - low] = b + 1
+        origins = []
+        
+        for t in range(b, n):
+            wt = weights[t]
+            prev = s[:]
+            origin = {}
+            
+            for m in range(r):
+                steps += 1
+                if prev[m] > s[m + wt]:
+                    s[m + wt] = prev[m]
+                    origin[m + wt] = -1
+            
+            for m in range(r - 1 + wt, r - 1, -1):
+                steps += 1
+                for j in range(s[m] - 1, prev[m] - 1, -1):
+                    steps += 1
+                    m2 = m - weights[j - 1]
+                    if s[m2] < j:
+                        s[m2] = j
+                        origin[m2] = j
+            
+            origins.append(origin)
+        
+        if not s[r - 1]:
+            return False, [], steps
+        
+        added = []
+        removed = set()
+        m = r - 1
+        t = n - 1
+        while t >= b:
+            steps += 1
+            code = origins[t - b].get(m, 0)
+            if code == 0:
+                t -= 1
+            elif code < 0:
+                added.append(t)
+                m -= weights[t]
+                t -= 1
+            else:
+                removed.add(code - 1)
+                m += weights[code - 1]
+        
+        chosen = [j for j in range(b) if j not in removed] + added[::-1]
+        return True, [self.numbers[items[j]] for j in chosen], steps
+    
+    def count_subset_sums(self, target):
+        if target < 0:
+            return 0, 0
+        
+        counts = np.zeros(target + 1, dtype=np.int64)
+        counts[0] = 1
+        largest = 1
+        steps = 0
+        
+        for num in self.numbers:
+            steps += 1
+            if num > target:
+                continue
+            largest *= 2
+            if counts.dtype != object and largest > np.iinfo(np.int64).max:
+                counts = counts.astype(object)
+            
+            if num == 0:
+                counts += counts
+            else:
+                counts[num:] += counts[:target + 1 - num].copy()
+        
+        return int(counts[target]), steps
+    
+    def iter_subset_sum_solutions(self, target):
+        if target < 0:
+            return
+        
+        rows = self._bitset_rows(target)
+        if not rows[-1] >> target & 1:
+            return
+        
+        stack = [(len(self.numbers), target, None)]
+        while stack:
+            i, remaining, chosen = stack.pop()
+            if i == 0:
+                subset = []
+                while chosen is not None:
+                    index, chosen = chosen
+                    subset.append(self.numbers[index])
+                yield subset
+                continue
+            
+            num = self.numbers[i - 1]
+            if rows[i - 1] >> remaining & 1:
+                stack.append((i - 1, remaining, chosen))
+            if num <= remaining and rows[i - 1] >> (remaining - num) & 1:
+                stack.append((i - 1, remaining - num, (i - 1, chosen)))
+    
+    def _bitset_rows(self, target):
+        mask = (1 << (target + 1)) - 1
+        reach = 1
+        rows = [reach]
+        for num in self.numbers:
+            if num <= target:
+                reach |= (reach << num) & mask
+            rows.append(reach)
+        return rows
+    
+    def _bitset_first_reaching(self, target):
+        n_words = target // 64 + 1
+        top_mask = np.uint64((1 << (target % 64 + 1)) - 1)
+        words = np.zeros(n_words, dtype=np.uint64)
+        words[0] = 1
+        first = np.full(target + 1, -1, dtype=np.int32 if len(self.numbers) < 2 ** 31 else np.int64)
+        shifted = np.zeros(n_words, dtype=np.uint64)
+        steps = 0
+        
+        for i, num in enumerate(self.numbers):
+            steps += 1
+            shift_words, shift_bits = divmod(num, 64)
+            if shift_words >= n_words:
+                continue
+            
+            shifted[:shift_words] = 0
+            source = words[:n_words - shift_words]
+            if shift_bits:
+                shifted[shift_words:] = source << np.uint64(shift_bits)
+                shifted[shift_words + 1:] |= source[:-1] >> np.uint64(64 - shift_bits)
+            else:
+                shifted[shift_words:] = source
+            shifted[-1] &= top_mask
+            
+            fresh = shifted & ~words
+            changed = np.flatnonzero(fresh)
+            if len(changed):
+                bits = np.unpackbits(fresh[changed].view(np.uint8), bitorder='little').reshape(-1, 64)
+                rows, cols = np.nonzero(bits)
+                first[changed[rows] * 64 + cols] = i
+                words |= fresh
+        
+        return first, steps
+    
     def measure_performance(self, n_range=(5, 20)):
         results = []
         
@@ -4,11 +4,13 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 
 import unittest
 import random
+import tempfile
+import numpy as np
 from src.np_problems.traveling_salesman import TravelingSalesman
 from src.np_problems.sat_solver import SATSolver
 from src.np_problems.knapsack import KnapsackSolver
 from src.np_problems.subset_sum import SubsetSum
-from src.np_problems.graph_coloring import GraphColoring
+from src.np_problems.graph_coloring import GraphColoring, _tabucol_moves
 
 class TestTravelingSalesman(unittest.TestCase):
     
@@ -109,6 +111,16 @@ class TestKnapsackSolver(unittest.TestCase):
         self.assertGreater(value, 0)
         self.assertGreater(steps, 0)
     
+    def test_bruteforce_matches_dynamic_programming(self):
+        for n_items in (6, 14):
+            with self.subTest(n_items=n_items):
+                self.knapsack.create_random_items(n_items, 30, 100)
+                _, expected, _, _ = self.knapsack.dynamic_programming_knapsack(70)
+                items, value, weight, steps = self.knapsack.brute_force_knapsack(70)
+                self.assertEqual(value, expected)
+                self.assertLessEqual(weight, 70)
+                self.assertEqual(steps, 2 ** n_items)
+    
     def test_greedy_value_density(self):
         capacity = 50
         items, value, weight, steps = self.knapsack.greedy_by_value_density(capacity)
@@ -125,6 +137,203 @@ class TestKnapsackSolver(unittest.TestCase):
         self.assertGreater(value, 0)
         self.assertGreater(steps, 0)
     
+    def test_dynamic_programming_matches_bruteforce(self):
+        self.knapsack.create_random_items(10, 30, 100)
+        
+        for capacity in (0, 25, 80):
+            with self.subTest(capacity=capacity):
+                _, expected, _, _ = self.knapsack.brute_force_knapsack(capacity)
+                items, value, weight, steps = self.knapsack.dynamic_programming_knapsack(capacity)
+                self.assertEqual(value, expected)
+                self.assertLessEqual(weight, capacity)
+                self.assertEqual(steps, 10 * (capacity + 1) + 10)
+    
+    def test_dynamic_programming_int64_overflow(self):
+        self.knapsack.add_item('D', 40, 2 ** 63)
+        items, value, weight, steps = self.knapsack.dynamic_programming_knapsack(60)
+        
+        self.assertEqual(value, 2 ** 63 + 100)
+        self.assertEqual(weight, 60)
+    
+    def test_branch_and_bound(self):
+        self.knapsack.create_random_items(40, 30, 100)
+        
+        for capacity in (0, 50, 300):
+            with self.subTest(capacity=capacity):
+                _, expected, _, _ = self.knapsack.dynamic_programming_knapsack(capacity)
+                items, value, weight, steps = self.knapsack.branch_and_bound_knapsack(capacity)
+                self.assertEqual(value, expected)
+                self.assertEqual(weight, sum(item['weight'] for item in items))
+                self.assertLessEqual(weight, capacity)
+                self.assertGreater(steps, 0)
+        
+        self.knapsack.items = []
+        for i in range(16):
+            weight = random.randint(1, 30)
+            self.knapsack.add_item(f'X_{i}', weight, 2 ** 70 * weight + random.randint(0, 40))
+        _, expected, _, _ = self.knapsack.dynamic_programming_knapsack(100)
+        items, value, weight, steps = self.knapsack.branch_and_bound_knapsack(100)
+        self.assertEqual(value, expected)
+    
+    def test_core_knapsack(self):
+        self.knapsack.create_random_items(60, 30, 100)
+        
+        for core_size in (1, 8, 64):
+            with self.subTest(core_size=core_size):
+                _, expected, _, _ = self.knapsack.dynamic_programming_knapsack(400)
+                items, value, weight, steps = self.knapsack.core_knapsack(400, core_size)
+                self.assertEqual(value, expected)
+                self.assertEqual(weight, sum(item['weight'] for item in items))
+                self.assertLessEqual(weight, 400)
+        
+        self.knapsack.items = []
+        for i in range(14):
+            weight = random.randint(1, 30)
+            self.knapsack.add_item(f'X_{i}', weight, 2 ** 70 * weight + random.randint(0, 40))
+        _, expected, _, _ = self.knapsack.dynamic_programming_knapsack(100)
+        items, value, weight, steps = self.knapsack.core_knapsack(100, 4)
+        self.assertEqual(value, expected)
+    
+    def test_pareto_knapsack(self):
+        items, value, weight, steps = self.knapsack.pareto_knapsack(50)
+        self.assertEqual(value, 220)
+        self.assertEqual([item['name'] for item in items], ['B', 'C'])
+        
+        self.knapsack.items = []
+        for i in range(30):
+            self.knapsack.add_item(f'X_{i}', random.randint(1, 10 ** 9), random.randint(1, 10 ** 9))
+        capacity = int(self.knapsack.weights.sum()) // 3
+        
+        _, expected, _, _ = self.knapsack.branch_and_bound_knapsack(capacity)
+        items, value, weight, steps = self.knapsack.pareto_knapsack(capacity)
+        self.assertEqual(value, expected)
+        self.assertLessEqual(weight, capacity)
+    
+    def test_fptas_knapsack(self):
+        self.knapsack.create_random_items(200, 100, 10 ** 6)
+        capacity = int(self.knapsack.weights.sum()) // 2
+        _, optimum, _, _ = self.knapsack.core_knapsack(capacity)
+        
+        for epsilon in (0.5, 0.1):
+            with self.subTest(epsilon=epsilon):
+                items, value, weight, steps, bound = self.knapsack.fptas_knapsack(capacity, epsilon)
+                self.assertLessEqual(weight, capacity)
+                self.assertGreaterEqual(value, (1 - epsilon) * optimum)
+                self.assertGreaterEqual(bound, optimum)
+        
+        for epsilon in (0, -0.5, 1, 2):
+            with self.assertRaises(ValueError):
+                self.knapsack.fptas_knapsack(capacity, epsilon)
+    
+    def test_compact_dynamic_programming(self):
+        self.knapsack.create_random_items(12, 30, 100)
+        _, expected, _, _ = self.knapsack.dynamic_programming_knapsack(60)
+        
+        for max_bytes in (1 << 20, 0):
+            with self.subTest(max_bitmatrix_bytes=max_bytes):
+                items, value, weight, steps = self.knapsack.compact_dynamic_programming_knapsack(60, max_bytes)
+                self.assertEqual(value, expected)
+                self.assertEqual(value, sum(item['value'] for item in items))
+                self.assertLessEqual(weight, 60)
+                self.assertGreater(steps, 0)
+    
+    def test_solve_all_capacities(self):
+        curve = self.knapsack.solve_all_capacities(60)
+        
+        self.assertEqual(len(curve), 61)
+        self.assertEqual(curve[50], 220)
+        self.assertEqual(curve[60], 280)
+        
+        items, value, weight, steps = self.knapsack.reconstruct_capacity(30)
+        self.assertEqual(value, 160)
+        self.assertEqual([item['name'] for item in items], ['A', 'B'])
+        
+        self.knapsack.add_item('D', 5, 50)
+        items, value, weight, steps = self.knapsack.reconstruct_capacity(35)
+        self.assertEqual(value, 210)
+    
+    def test_incremental_knapsack(self):
+        items, value, weight, steps = self.knapsack.incremental_knapsack(50)
+        self.assertEqual(value, 220)
+        self.assertEqual(steps, 3 * 51 + 3)
+        
+        self.knapsack.add_item('D', 5, 50)
+        items, value, weight, steps = self.knapsack.incremental_knapsack(50)
+        self.assertEqual(value, 230)
+        self.assertEqual(steps, 51 + 4)
+        
+        self.knapsack.remove_item(0)
+        items, value, weight, steps = self.knapsack.incremental_knapsack(50)
+        self.assertEqual(value, 220)
+        self.assertEqual(steps, 3 * 51 + 3)
+        
+        self.knapsack.reorder_items([2, 0, 1])
+        _, expected, _, _ = self.knapsack.dynamic_programming_knapsack(40)
+        items, value, weight, steps = self.knapsack.incremental_knapsack(40)
+        self.assertEqual(value, expected)
+        self.assertEqual([item['name'] for item in self.knapsack.items], ['D', 'B', 'C'])
+    
+    def test_solve_batch(self):
+        instances = [self.knapsack.generate_knapsack_instance(n, 2) for n in (3, 8, 12, 12, 20)]
+        instances.append({'items': self.knapsack.items, 'capacity': 50})
+        instances.append({'items': [{'name': 'F', 'weight': 1, 'value': 0.75},
+                                    {'name': 'G', 'weight': 4, 'value': 0.5}], 'capacity': 4})
+        instances.append({'items': [{'name': 'H', 'weight': 3, 'value': 2 ** 70},
+                                    {'name': 'I', 'weight': 3, 'value': 5}], 'capacity': 5})
+        results = self.knapsack.solve_batch(instances)
+        
+        self.assertEqual(len(results), len(instances))
+        self.assertEqual(results[-3][1], 220)
+        self.assertEqual(results[-2][1], 0.75)
+        self.assertEqual(results[-1][1], 2 ** 70)
+        for instance, (items, value, weight, steps) in zip(instances, results):
+            solver = KnapsackSolver()
+            solver.items = instance['items']
+            _, expected, _, expected_steps = solver.dynamic_programming_knapsack(instance['capacity'])
+            self.assertEqual(value, expected)
+            self.assertEqual(steps, expected_steps)
+            self.assertLessEqual(weight, instance['capacity'])
+        
+        results = self.knapsack.solve_batch([{'items': self.knapsack.items, 'capacity': np.int64(50)},
+                                             {'items': [], 'capacity': 10}, {'items': [], 'capacity': 20}])
+        self.assertEqual(results[0][1], 220)
+        self.assertIsNot(results[1][0], results[2][0])
+    
+    def test_bounded_knapsack(self):
+        self.knapsack.add_item('D', 7, 40, count=3000)
+        items, value, weight, steps = self.knapsack.bounded_knapsack(100)
+        
+        self.assertEqual(value, 560)
+        self.assertEqual(weight, 100)
+        self.assertEqual({item['name']: item['count'] for item in items}, {'A': 1, 'B': 1, 'D': 10})
+        self.assertEqual(self.knapsack.items[3]['count'], 3000)
+        self.assertNotIn('count', self.knapsack.items[0])
+        
+        self.knapsack.items = []
+        self.knapsack.add_item('A', 1, 10 ** 16, count=2000)
+        items, value, weight, steps = self.knapsack.bounded_knapsack(2000)
+        
+        self.assertEqual(value, 2 * 10 ** 19)
+        self.assertEqual(items[0]['count'], 2000)
+    
+    def test_item_arrays(self):
+        for i in range(40):
+            self.knapsack.add_item(f'X_{i}', i + 1, 2 * i)
+        
+        self.assertEqual(len(self.knapsack.items), 43)
+        self.assertEqual(self.knapsack.weights.dtype.kind, 'i')
+        self.assertEqual(self.knapsack.weights[:3].tolist(), [10, 20, 30])
+        self.assertEqual(self.knapsack.values[-1], 78)
+        self.assertEqual(self.knapsack.names[3], 'X_0')
+        self.assertEqual(self.knapsack.items[42], {'name': 'X_39', 'weight': 40, 'value': 78})
+        
+        with self.assertRaises(AttributeError):
+            self.knapsack.items.append({'name': 'Y', 'weight': 1, 'value': 1})
+        with self.assertRaises(ValueError):
+            self.knapsack.weights[0] = 1
+        with self.assertRaises(ValueError):
+            self.knapsack.values[0] = 1
+    
     def test_random_items(self):
         items = self.knapsack.create_random_items(10, 50, 100)
         self.assertEqual(len(items), 10)
@@ -152,6 +361,18 @@ class TestSubsetSum(unittest.TestCase):
         self.assertEqual(sum(subset), target)
         self.assertGreater(steps, 0)
     
+    def test_bruteforce_gray_code_blocks(self):
+        numbers = self.numbers + [101, 202, 303, 404, 505, 606, 707, 808]
+        self.subset_sum.set_numbers(numbers)
+        
+        found, subset, steps = self.subset_sum.brute_force_subset_sum(1010 + 9)
+        self.assertTrue(found)
+        self.assertEqual(sum(subset), 1019)
+        
+        found, subset, steps = self.subset_sum.brute_force_subset_sum(1)
+        self.assertFalse(found)
+        self.assertEqual(steps, 2 ** len(numbers))
+    
     def test_no_solution(self):
         target = 1000
         self.subset_sum.set_numbers(self.numbers)
@@ -170,6 +391,78 @@ class TestSubsetSum(unittest.TestCase):
         self.assertTrue(found)
         self.assertEqual(sum(subset), target)
     
+    def test_meet_in_the_middle(self):
+        self.subset_sum.set_numbers(self.numbers)
+        found, subset, steps = self.subset_sum.meet_in_the_middle(9)
+        self.assertTrue(found)
+        self.assertEqual(sum(subset), 9)
+        
+        numbers = [random.randint(1, 10 ** 9) for _ in range(30)]
+        self.subset_sum.set_numbers(numbers)
+        target = sum(numbers[::4])
+        found, subset, steps = self.subset_sum.meet_in_the_middle(target, chunk_size=1000)
+        self.assertTrue(found)
+        self.assertEqual(sum(subset), target)
+        
+        found, subset, steps = self.subset_sum.meet_in_the_middle(sum(numbers) + 1)
+        self.assertFalse(found)
+    
+    def test_schroeppel_shamir(self):
+        numbers = [random.randint(1, 10 ** 9) for _ in range(24)]
+        self.subset_sum.set_numbers(numbers)
+        target = sum(numbers[1::3])
+        
+        found, subset, steps = self.subset_sum.schroeppel_shamir(target)
+        self.assertTrue(found)
+        self.assertEqual(sum(subset), target)
+        
+        found, subset, steps = self.subset_sum.schroeppel_shamir(sum(numbers) + 1)
+        self.assertFalse(found)
+        self.assertGreater(steps, 0)
+    
+    def test_bitset_subset_sum(self):
+        self.subset_sum.set_numbers(self.numbers)
+        
+        for engine in ('int', 'numpy', 'balanced'):
+            with self.subTest(engine=engine):
+                found, subset, steps = self.subset_sum.bitset_subset_sum(9, engine)
+                self.assertTrue(found)
+                self.assertEqual(sum(subset), 9)
+                
+                found, subset, steps = self.subset_sum.bitset_subset_sum(61, engine)
+                self.assertFalse(found)
+                self.assertEqual(subset, [])
+        
+        self.subset_sum.set_numbers([5, 10 ** 10, 3])
+        found, subset, steps = self.subset_sum.bitset_subset_sum(8, 'int')
+        self.assertEqual(subset, [5, 3])
+        self.assertEqual(list(self.subset_sum.iter_subset_sum_solutions(5)), [[5]])
+    
+    def test_balanced_subset_sum(self):
+        numbers = [random.randint(1, 10) for _ in range(3000)]
+        self.subset_sum.set_numbers(numbers)
+        
+        found, subset, steps = self.subset_sum.bitset_subset_sum(10000)
+        self.assertTrue(found)
+        self.assertEqual(sum(subset), 10000)
+        self.assertEqual(found, self.subset_sum.bitset_subset_sum(10000, 'int')[0])
+        
+        self.subset_sum.set_numbers([2] * 3000)
+        found, subset, steps = self.subset_sum.balanced_subset_sum(4001)
+        self.assertFalse(found)
+    
+    def test_count_and_enumerate_solutions(self):
+        self.subset_sum.set_numbers(self.numbers)
+        count, steps = self.subset_sum.count_subset_sums(9)
+        solutions = list(self.subset_sum.iter_subset_sum_solutions(9))
+        
+        self.assertEqual(count, 2)
+        self.assertEqual(sorted(sorted(subset) for subset in solutions), [[2, 3, 4], [4, 5]])
+        
+        self.subset_sum.set_numbers([1] * 70)
+        count, steps = self.subset_sum.count_subset_sums(35)
+        self.assertEqual(count, 112186277816662845432)
+    
     def test_random_numbers(self):
         numbers = self.subset_sum.create_random_numbers(10, 100)
         self.assertEqual(len(numbers), 10)
@@ -199,6 +492,15 @@ class TestGraphColoring(unittest.TestCase):
             for neighbor in self.coloring.graph[node]:
                 self.assertNotEqual(coloring[node], coloring[neighbor])
     
+    def test_bruteforce_coloring_blocks(self):
+        expected = self.coloring.brute_force_coloring(3)
+        for block_size in (1, 3, 10):
+            self.assertEqual(self.coloring.brute_force_coloring(3, block_size), expected)
+        
+        possible, coloring, steps = self.coloring.brute_force_coloring(2, block_size=4)
+        self.assertFalse(possible)
+        self.assertEqual(steps, 2 ** 4)
+    
     def test_greedy_coloring(self):
         coloring, steps = self.coloring.greedy_coloring()
         
@@ -209,6 +511,29 @@ class TestGraphColoring(unittest.TestCase):
             for neighbor in self.coloring.graph[node]:
                 self.assertNotEqual(coloring[node], coloring[neighbor])
     
+    def test_csr_colorings(self):
+        nodes, indptr, indices = self.coloring.to_csr()
+        self.assertEqual(nodes, [0, 1, 2, 3])
+        self.assertEqual(indptr.tolist(), [0, 2, 5, 7, 8])
+        
+        self.coloring.add_edge(3, 4)
+        nodes, indptr, indices = self.coloring.to_csr()
+        self.assertEqual(len(nodes), 5)
+        self.assertEqual(len(indices), 10)
+        
+        for method in (self.coloring.welsh_powell_coloring, self.coloring.smallest_last_coloring):
+            coloring, steps = method()
+            self.assertEqual(len(set(coloring.values())), 3)
+            for node in coloring:
+                for neighbor in self.coloring.graph[node]:
+                    self.assertNotEqual(coloring[node], coloring[neighbor])
+        
+        self.coloring.graph[4].add(5)
+        self.coloring.graph[5] = {4}
+        coloring, steps = self.coloring.greedy_coloring()
+        self.assertEqual(len(coloring), 6)
+        self.assertNotEqual(coloring[4], coloring[5])
+    
     def test_backtracking_coloring(self):
         k = 3
         coloring, steps = self.coloring.backtracking_coloring(k)
@@ -216,6 +541,127 @@ class TestGraphColoring(unittest.TestCase):
         self.assertEqual(len(coloring), 4)
         self.assertGreater(steps, 0)
     
+    def test_bitset_backtracking_coloring(self):
+        coloring, steps = self.coloring.bitset_backtracking_coloring(3)
+        
+        self.assertEqual(len(coloring), 4)
+        for node in coloring:
+            for neighbor in self.coloring.graph[node]:
+                self.assertNotEqual(coloring[node], coloring[neighbor])
+        
+        coloring, steps = self.coloring.bitset_backtracking_coloring(2)
+        self.assertEqual(coloring, {})
+        self.assertGreater(steps, 0)
+        
+        self.coloring.create_random_graph(200, 0.02)
+        coloring, steps = self.coloring.bitset_backtracking_coloring(6)
+        self.assertEqual(len(coloring), 200)
+        for node in coloring:
+            for neighbor in self.coloring.graph[node]:
+                self.assertNotEqual(coloring[node], coloring[neighbor])
+    
+    def test_parallel_backtracking_coloring(self):
+        coloring, steps = self.coloring.parallel_backtracking_coloring(3, workers=2)
+        
+        self.assertEqual(len(coloring), 4)
+        for node in coloring:
+            for neighbor in self.coloring.graph[node]:
+                self.assertNotEqual(coloring[node], coloring[neighbor])
+        
+        self.coloring.create_random_graph(30, 0.3)
+        chromatic = self.coloring.chromatic_number()[0]
+        for workers in (1, 2):
+            coloring, steps = self.coloring.parallel_backtracking_coloring(chromatic - 1, workers=workers)
+            self.assertEqual(coloring, {})
+            coloring, steps = self.coloring.parallel_backtracking_coloring(chromatic, workers=workers, depth=3)
+            self.assertEqual(len(coloring), 30)
+    
+    def test_chromatic_number(self):
+        chromatic, coloring, steps = self.coloring.chromatic_number()
+        
+        self.assertEqual(chromatic, 3)
+        self.assertEqual(len(set(coloring.values())), 3)
+        for node in coloring:
+            for neighbor in self.coloring.graph[node]:
+                self.assertNotEqual(coloring[node], coloring[neighbor])
+        
+        for n_nodes in range(1, 8):
+            instance = self.coloring.generate_coloring_instance(n_nodes, 0.5)
+            expected = next(k for k in range(1, n_nodes + 1) if self.coloring.brute_force_coloring(k)[0])
+            self.assertEqual(instance['chromatic_number'], expected)
+        
+        self.coloring.graph = {i: set() for i in range(1505)}
+        for u, v in [(i, i + 1) for i in range(1499)] + [(1500 + i, 1500 + (i + 1) % 5) for i in range(5)]:
+            self.coloring.add_edge(u, v)
+        chromatic, coloring, steps = self.coloring.chromatic_number(tabu_iterations=100)
+        self.assertEqual(chromatic, 3)
+    
+    def test_inclusion_exclusion_coloring(self):
+        chromatic, steps = self.coloring.inclusion_exclusion_chromatic_number()
+        self.assertEqual(chromatic, 3)
+        self.assertGreater(steps, 0)
+        
+        self.assertEqual(self.coloring.count_colorings(2)[0], 0)
+        self.assertEqual(self.coloring.count_colorings(3)[0], 12)
+        self.assertEqual(self.coloring.count_colorings(50)[0], 50 * 49 * 48 * 49)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'sums.bin')
+            self.assertEqual(self.coloring.count_colorings(50, memmap_path=path)[0], 50 * 49 * 48 * 49)
+        
+        self.coloring.create_random_graph(31, 0.1)
+        with self.assertRaises(ValueError):
+            self.coloring.count_colorings(3)
+        
+        self.coloring.create_random_graph(12, 0.4)
+        self.assertEqual(self.coloring.inclusion_exclusion_chromatic_number()[0],
+                         self.coloring.chromatic_number()[0])
+    
+    def test_tabucol_coloring(self):
+        coloring, steps = self.coloring.tabucol_coloring(workers=2, seed=1)
+        
+        self.assertEqual(len(set(coloring.values())), 3)
+        for node in coloring:
+            for neighbor in self.coloring.graph[node]:
+                self.assertNotEqual(coloring[node], coloring[neighbor])
+        
+        coloring, steps = self.coloring.tabucol_coloring(k=2, workers=1, max_iterations=500)
+        self.assertEqual(coloring, {})
+        self.assertEqual(steps, 500)
+    
+    def test_tabucol_conflict_count(self):
+        for seed in range(100):
+            random.seed(seed)
+            self.coloring.create_random_graph(random.randint(4, 9), 0.3)
+            nodes, adj = self.coloring._index_graph()
+            
+            moves = _tabucol_moves(adj, 2, seed)
+            for _, (colors, gamma, conflicts) in zip(range(300), moves):
+                self.assertEqual(conflicts, int(gamma[range(len(nodes)), colors].sum()) // 2)
+        
+        random.seed(204)
+        self.coloring.create_random_graph(random.randint(4, 9), 0.3)
+        coloring, steps = self.coloring.tabucol_coloring(k=2, workers=1, seed=204, max_iterations=2000)
+        for node in coloring:
+            for neighbor in self.coloring.graph[node]:
+                self.assertNotEqual(coloring[node], coloring[neighbor])
+    
+    def test_incremental_coloring(self):
+        coloring, steps = self.coloring.enable_incremental_coloring(max_extra_colors=1)
+        self.assertEqual(len(set(coloring.values())), 3)
+        
+        edges = [(3, 0), (3, 2), (4, 0), (4, 1), (5, 4), (5, 2), (2, 4)]
+        for u, v in edges:
+            self.coloring.add_edge(u, v)
+            coloring, steps = self.coloring.incremental_coloring()
+            self.assertEqual(len(coloring), len(self.coloring.graph))
+            for node in coloring:
+                for neighbor in self.coloring.graph[node]:
+                    self.assertNotEqual(coloring[node], coloring[neighbor])
+        
+        self.assertLessEqual(len(set(coloring.values())), 5)
+        self.coloring.disable_incremental_coloring()
+        self.assertEqual(self.coloring.incremental_coloring(), ({}, 0))
+    
     def test_random_graph(self):
         graph = self.coloring.create_random_graph(10, 0.3)
         self.assertEqual(len(graph), 10)